@@ -6,13 +6,17 @@ and professional UI components.
 
 from flask import Flask, render_template, request, Response, jsonify, send_file
 from werkzeug.utils import secure_filename
+import re
 import subprocess
 import json
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
 from datetime import datetime
 import os
+import stat
 import time
 import shutil
 from pathlib import Path
@@ -24,6 +28,11 @@ from typing import List, Dict, Any, Optional
 from flask_cors import CORS
 from claude_auth import ClaudeAuthManager, EnhancedProcessManager, create_claude_auth_manager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Application Configuration
 class Config:
     """Application configuration"""
@@ -36,13 +45,49 @@ class Config:
     PORT = 80
     DEBUG = False
     MAX_UPLOAD_SIZE = 100 * 1024 * 1024  # 100MB
+    MAX_FILE_READ_SIZE = 1 * 1024 * 1024  # 1MB cap for file content responses
     ALLOWED_EXTENSIONS = {'.java', '.xml', '.properties', '.yml', '.yaml', '.json', '.txt', '.md', '.gradle', '.pom'}
 
+# Absolute base folders resolved once at import - the security checks in the
+# file routes run per request and should not pay abspath syscalls each time
+_ABS_INPUT_FOLDER = os.path.abspath(Config.INPUT_FOLDER)
+_ABS_OUTPUT_FOLDER = os.path.abspath(Config.OUTPUT_FOLDER)
+_ABS_DATA_FOLDER = os.path.abspath(Config.DATA_FOLDER)
+
+# Fixed application paths, built once instead of per request
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+PROMPTS_DIR = os.path.join(APP_DIR, 'prompts')
+PROMPTS_BACKUP_DIR = os.path.join(APP_DIR, 'prompts-backup')
+CONTEXT_FILE = os.path.join(PROMPTS_DIR, 'context.md')
+FIX_FILE = os.path.join(PROMPTS_DIR, 'fix.md')
+RULES_FILE = os.path.join(Config.DATA_FOLDER, 'rules')
+ISSUES_FILE = os.path.join(Config.DATA_FOLDER, 'issues')
+
 # Initialize Flask app
 app = Flask(__name__)
 CORS(app)
 app.config['MAX_CONTENT_LENGTH'] = Config.MAX_UPLOAD_SIZE
 
+# Serialize responses with orjson when available - it encodes large file
+# trees several times faster than the stdlib encoder used by jsonify
+if orjson is not None:
+    try:
+        from flask.json.provider import DefaultJSONProvider
+
+        class OrjsonProvider(DefaultJSONProvider):
+            """JSON provider backed by orjson"""
+
+            def dumps(self, obj, **kwargs):
+                return orjson.dumps(obj, default=self.default).decode('utf-8')
+
+            def loads(self, s, **kwargs):
+                return orjson.loads(s)
+
+        app.json = OrjsonProvider(app)
+    except ImportError:
+        # Older Flask without the provider API - keep the stdlib encoder
+        pass
+
 # Set up logging
 logging.basicConfig(
     level=Config.LOG_LEVEL,
@@ -71,13 +116,40 @@ try:
     app_state.enhanced_process_manager = EnhancedProcessManager(app_state.auth_manager)
     logger.info("Claude authentication manager initialized successfully")
 except Exception as e:
-    logger.error(f"Failed to initialize Claude authentication: {e}")
+    logger.error("Failed to initialize Claude authentication: %s", e)
     logger.warning("Running without authentication manager - manual API key may be required")
 
 # File System Operations
 class FileManager:
     """Handles file system operations and monitoring"""
 
+    # Short-TTL cache of computed file trees - the monitor rebuilds every
+    # second, and the /api/files endpoint should reuse that work instead of
+    # re-walking the folder for each poll
+    _tree_cache: Dict[str, Any] = {}
+    _tree_cache_lock = threading.Lock()
+    TREE_CACHE_TTL = 1.0
+
+    @staticmethod
+    def get_file_tree_cached(directory: str) -> List[Dict[str, Any]]:
+        """Get a file tree, reusing a recent result if one exists"""
+        now = time.monotonic()
+        with FileManager._tree_cache_lock:
+            cached = FileManager._tree_cache.get(directory)
+            if cached and now - cached[0] < FileManager.TREE_CACHE_TTL:
+                return cached[1]
+
+        tree = FileManager.get_file_tree(directory, directory)
+        with FileManager._tree_cache_lock:
+            FileManager._tree_cache[directory] = (now, tree)
+        return tree
+
+    @staticmethod
+    def invalidate_tree_cache():
+        """Drop cached trees after a mutation so readers see fresh state"""
+        with FileManager._tree_cache_lock:
+            FileManager._tree_cache.clear()
+
     @staticmethod
     def get_file_tree(directory: str, base_directory: str = None) -> List[Dict[str, Any]]:
         """Get file tree structure for a directory"""
@@ -89,56 +161,84 @@ class FileManager:
             base_directory = directory
 
         tree = []
-        try:
-            for item in sorted(os.listdir(directory)):
-                if item.startswith('.'):
-                    continue
+        # Explicit stack instead of recursion - one loop walks the whole
+        # tree without paying a Python frame per directory
+        stack = [(directory, tree)]
+        while stack:
+            path, children = stack.pop()
+            try:
+                # scandir caches stat info on each entry, so we avoid the
+                # extra isdir/stat syscalls that listdir-based walks pay
+                with os.scandir(path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
 
-                item_path = os.path.join(directory, item)
-                # Calculate relative path from the base directory
-                relative_path = os.path.relpath(item_path, base_directory)
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
 
-                if os.path.isdir(item_path):
-                    tree.append({
-                        'name': item,
-                        'type': 'folder',
-                        'path': relative_path,
-                        'children': FileManager.get_file_tree(item_path, base_directory)
-                    })
-                else:
-                    # Get file size and modification time
-                    stat = os.stat(item_path)
-                    tree.append({
-                        'name': item,
-                        'type': 'file',
-                        'path': relative_path,
-                        'size': stat.st_size,
-                        'modified': stat.st_mtime
-                    })
-        except PermissionError as e:
-            logger.warning(f"Permission denied accessing {directory}: {e}")
-        except Exception as e:
-            logger.error(f"Error reading directory {directory}: {e}")
+                    # Calculate relative path from the base directory
+                    relative_path = os.path.relpath(entry.path, base_directory)
+
+                    # One stat per entry; S_ISDIR is a C-level bitmask test,
+                    # so no second is_dir/stat round trip is needed
+                    st = entry.stat(follow_symlinks=False)
+                    if stat.S_ISDIR(st.st_mode):
+                        node = {
+                            'name': entry.name,
+                            'type': 'folder',
+                            'path': relative_path,
+                            'children': []
+                        }
+                        children.append(node)
+                        stack.append((entry.path, node['children']))
+                    else:
+                        children.append({
+                            'name': entry.name,
+                            'type': 'file',
+                            'path': relative_path,
+                            'size': st.st_size,
+                            'modified': st.st_mtime
+                        })
+            except PermissionError as e:
+                logger.warning("Permission denied accessing %s: %s", path, e)
+            except Exception as e:
+                logger.error("Error reading directory %s: %s", path, e)
 
         return tree
 
     @staticmethod
-    def read_file_content(file_path: str, folder_type: str = 'input') -> Dict[str, Any]:
-        """Read file content with proper encoding detection"""
+    def resolve_file_path(file_path: str, folder_type: str = 'input') -> str:
+        """Resolve a requested path against its base folder with containment checks"""
         if folder_type == 'input':
             base_folder = app_state.selected_input_folder
+            abs_base = _ABS_INPUT_FOLDER if base_folder == Config.INPUT_FOLDER \
+                else os.path.abspath(base_folder)
         else:  # output
             base_folder = Config.OUTPUT_FOLDER
+            abs_base = _ABS_OUTPUT_FOLDER
 
         full_path = os.path.join(base_folder, file_path)
 
-        # Security check - ensure path is within the specified folder
-        if not os.path.abspath(full_path).startswith(os.path.abspath(base_folder)):
+        # Security check - ensure path is within the specified folder.
+        # commonpath is component-wise, so a sibling folder sharing the
+        # prefix (e.g. input2 vs input) cannot slip through
+        try:
+            inside = os.path.commonpath([os.path.abspath(full_path), abs_base]) == abs_base
+        except ValueError:
+            inside = False
+        if not inside:
             raise ValueError(f'Access denied - path outside {folder_type} folder')
 
         if not os.path.exists(full_path) or not os.path.isfile(full_path):
             raise FileNotFoundError('File not found')
 
+        return full_path
+
+    @staticmethod
+    def read_file_content(file_path: str, folder_type: str = 'input') -> Dict[str, Any]:
+        """Read file content with proper encoding detection"""
+        full_path = FileManager.resolve_file_path(file_path, folder_type)
+
         # Get file info
         stat = os.stat(full_path)
         file_info = {
@@ -148,22 +248,26 @@ class FileManager:
             'name': os.path.basename(file_path)
         }
 
-        # Try to read file content
+        # Read at most MAX_FILE_READ_SIZE bytes in binary mode so huge files
+        # are truncated at the OS level instead of loaded fully into memory
+        max_size = Config.MAX_FILE_READ_SIZE
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            file_info['content'] = content
-            file_info['encoding'] = 'utf-8'
-        except UnicodeDecodeError:
-            # Try binary read for non-text files
+            with open(full_path, 'rb') as f:
+                raw = f.read(max_size + 1)
+
+            file_info['truncated'] = len(raw) > max_size
+            if file_info['truncated']:
+                raw = raw[:max_size]
+
             try:
-                with open(full_path, 'rb') as f:
-                    content = f.read()
-                file_info['content'] = content.decode('utf-8', errors='replace')
-                file_info['encoding'] = 'binary'
-            except Exception:
-                file_info['content'] = '[Binary file - cannot display]'
+                file_info['content'] = raw.decode('utf-8')
+                file_info['encoding'] = 'utf-8'
+            except UnicodeDecodeError:
+                file_info['content'] = raw.decode('utf-8', errors='replace')
                 file_info['encoding'] = 'binary'
+        except Exception:
+            file_info['content'] = '[Binary file - cannot display]'
+            file_info['encoding'] = 'binary'
 
         return file_info
 
@@ -188,7 +292,7 @@ class FileManager:
                         items_removed += 1
                         total_size += file_size
                     except Exception as e:
-                        logger.warning(f"Could not remove file {file_path}: {e}")
+                        logger.warning("Could not remove file %s: %s", file_path, e)
 
                 # Remove empty directories
                 for dir_name in dirs:
@@ -198,7 +302,7 @@ class FileManager:
                             os.rmdir(dir_path)
                             items_removed += 1
                     except Exception as e:
-                        logger.warning(f"Could not remove directory {dir_path}: {e}")
+                        logger.warning("Could not remove directory %s: %s", dir_path, e)
 
             # Remove any remaining empty subdirectories
             for root, dirs, files in os.walk(Config.OUTPUT_FOLDER, topdown=False):
@@ -210,6 +314,8 @@ class FileManager:
                     except Exception:
                         pass  # Ignore errors for non-empty directories
 
+            FileManager.invalidate_tree_cache()
+
             return {
                 'success': True,
                 'message': f'Output folder cleaned successfully',
@@ -218,7 +324,7 @@ class FileManager:
             }
 
         except Exception as e:
-            logger.error(f"Error cleaning output folder: {e}")
+            logger.error("Error cleaning output folder: %s", e)
             return {
                 'success': False,
                 'message': f'Error cleaning output folder: {str(e)}'
@@ -261,7 +367,7 @@ class FileManager:
                             file_types['no_extension'] = file_types.get('no_extension', 0) + 1
 
                     except Exception as e:
-                        logger.warning(f"Could not access file {file_path}: {e}")
+                        logger.warning("Could not access file %s: %s", file_path, e)
 
             return {
                 'exists': True,
@@ -273,7 +379,7 @@ class FileManager:
             }
 
         except Exception as e:
-            logger.error(f"Error getting input info: {e}")
+            logger.error("Error getting input info: %s", e)
             return {
                 'exists': False,
                 'message': f'Error accessing input folder: {str(e)}',
@@ -290,8 +396,8 @@ class FileManager:
 
             # Security check - ensure we're within the data folder
             directory_path = os.path.abspath(directory_path)
-            data_folder_abs = os.path.abspath(Config.DATA_FOLDER)
-            
+            data_folder_abs = _ABS_DATA_FOLDER
+
             # Restrict browsing to data folder only
             if not directory_path.startswith(data_folder_abs):
                 directory_path = data_folder_abs
@@ -321,25 +427,29 @@ class FileManager:
                 # Skip system files when browsing data folder root
                 skip_items = {'rules', 'issues'} if directory_path == data_folder_abs else set()
                 
-                for item in sorted(os.listdir(directory_path)):
-                    if item.startswith('.') or item in skip_items:
+                # One scandir snapshot with cached stat info instead of a
+                # listdir plus per-entry isdir/stat round trips
+                with os.scandir(directory_path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+
+                for entry in entries:
+                    if entry.name.startswith('.') or entry.name in skip_items:
                         continue
 
-                    item_path = os.path.join(directory_path, item)
-                    if os.path.isdir(item_path):
-                        # Get folder info
-                        try:
-                            stat = os.stat(item_path)
-                            items.append({
-                                'name': item,
-                                'type': 'folder',
-                                'path': item_path,
-                                'display_name': item,
-                                'modified': stat.st_mtime
-                            })
-                        except PermissionError:
-                            # Skip folders we can't access
+                    try:
+                        if not entry.is_dir():
                             continue
+                        st = entry.stat()
+                        items.append({
+                            'name': entry.name,
+                            'type': 'folder',
+                            'path': entry.path,
+                            'display_name': entry.name,
+                            'modified': st.st_mtime
+                        })
+                    except PermissionError:
+                        # Skip folders we can't access
+                        continue
 
             except PermissionError:
                 return {
@@ -356,7 +466,7 @@ class FileManager:
             }
 
         except Exception as e:
-            logger.error(f"Error browsing directory {directory_path}: {e}")
+            logger.error("Error browsing directory %s: %s", directory_path, e)
             return {
                 'success': False,
                 'message': f'Error browsing directory: {str(e)}',
@@ -381,53 +491,47 @@ class FileManager:
                     'message': 'Path is not a directory'
                 }
 
-            # Step 1: Clear current input folder
+            # Step 1: Clear current input folder in one shot
             logger.info(f"Clearing current input folder: {Config.INPUT_FOLDER}")
-            if os.path.exists(Config.INPUT_FOLDER):
-                # Remove all contents of input folder
-                for item in os.listdir(Config.INPUT_FOLDER):
-                    item_path = os.path.join(Config.INPUT_FOLDER, item)
-                    try:
-                        if os.path.isfile(item_path):
-                            os.remove(item_path)
-                        elif os.path.isdir(item_path):
-                            shutil.rmtree(item_path)
-                    except Exception as e:
-                        logger.warning(f"Could not remove {item_path}: {e}")
-            else:
-                # Create input folder if it doesn't exist
-                os.makedirs(Config.INPUT_FOLDER)
+            shutil.rmtree(Config.INPUT_FOLDER, ignore_errors=True)
+            os.makedirs(Config.INPUT_FOLDER, exist_ok=True)
 
-            # Step 2: Copy selected folder contents to input folder
+            # Step 2: Copy selected folder contents to input folder. Each
+            # top-level entry is copied on its own thread; the copyfile fast
+            # path blocks in the kernel, so the workers overlap on IO
             logger.info(f"Copying contents from {folder_path} to {Config.INPUT_FOLDER}")
+
+            def _copy_entry(entry):
+                dest_path = os.path.join(Config.INPUT_FOLDER, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.copytree(entry.path, dest_path, dirs_exist_ok=True,
+                                    copy_function=shutil.copyfile)
+                else:
+                    shutil.copyfile(entry.path, dest_path)
+
+            try:
+                with os.scandir(folder_path) as it:
+                    entries = list(it)
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    list(pool.map(_copy_entry, entries))
+            except Exception as e:
+                logger.error("Error copying %s to %s: %s", folder_path, Config.INPUT_FOLDER, e)
+                return {
+                    'success': False,
+                    'message': f'Error copying files: {str(e)}'
+                }
+
+            # Count copied files in a single pass for the response
             files_copied = 0
             total_size = 0
-            
-            for item in os.listdir(folder_path):
-                source_path = os.path.join(folder_path, item)
-                dest_path = os.path.join(Config.INPUT_FOLDER, item)
-                
-                try:
-                    if os.path.isfile(source_path):
-                        shutil.copy2(source_path, dest_path)
-                        files_copied += 1
-                        total_size += os.path.getsize(source_path)
-                    elif os.path.isdir(source_path):
-                        shutil.copytree(source_path, dest_path)
-                        # Count files in copied directory
-                        for root, dirs, files in os.walk(dest_path):
-                            files_copied += len(files)
-                            for file in files:
-                                total_size += os.path.getsize(os.path.join(root, file))
-                except Exception as e:
-                    logger.error(f"Error copying {source_path} to {dest_path}: {e}")
-                    return {
-                        'success': False,
-                        'message': f'Error copying files: {str(e)}'
-                    }
+            for root, dirs, files in os.walk(Config.INPUT_FOLDER):
+                files_copied += len(files)
+                for file in files:
+                    total_size += os.path.getsize(os.path.join(root, file))
 
             # Update the selected input folder to point to the service's input folder
             app_state.selected_input_folder = Config.INPUT_FOLDER
+            FileManager.invalidate_tree_cache()
             logger.info(f"Input folder updated with {files_copied} files ({total_size} bytes) from: {folder_path}")
 
             return {
@@ -440,7 +544,7 @@ class FileManager:
             }
 
         except Exception as e:
-            logger.error(f"Error setting input folder: {e}")
+            logger.error("Error setting input folder: %s", e)
             return {
                 'success': False,
                 'message': f'Error setting input folder: {str(e)}'
@@ -453,36 +557,36 @@ class FileMonitor:
     @staticmethod
     def monitor_files():
         """Monitor file changes in both input and output directories"""
-        last_trees = {'input': {}, 'output': {}}
+        last_trees = {'input': None, 'output': None}
 
         while app_state.file_monitor_running:
             try:
-                # Monitor output folder
-                output_tree = FileManager.get_file_tree(Config.OUTPUT_FOLDER)
-                output_tree_str = json.dumps(output_tree, sort_keys=True)
+                # Monitor output folder - compare the structures directly,
+                # serializing them to sorted JSON just to detect change
+                # costs a full dump per folder per second
+                output_tree = FileManager.get_file_tree_cached(Config.OUTPUT_FOLDER)
 
-                if output_tree_str != last_trees['output'].get('str', ''):
+                if output_tree != last_trees['output']:
                     app_state.file_update_queue.put({
                         'type': 'file_tree_update',
                         'folder_type': 'output',
                         'data': output_tree
                     })
-                    last_trees['output']['str'] = output_tree_str
+                    last_trees['output'] = output_tree
 
                 # Monitor input folder
-                input_tree = FileManager.get_file_tree(app_state.selected_input_folder)
-                input_tree_str = json.dumps(input_tree, sort_keys=True)
+                input_tree = FileManager.get_file_tree_cached(app_state.selected_input_folder)
 
-                if input_tree_str != last_trees['input'].get('str', ''):
+                if input_tree != last_trees['input']:
                     app_state.file_update_queue.put({
                         'type': 'file_tree_update',
                         'folder_type': 'input',
                         'data': input_tree
                     })
-                    last_trees['input']['str'] = input_tree_str
+                    last_trees['input'] = input_tree
 
             except Exception as e:
-                logger.error(f"Error monitoring files: {e}")
+                logger.error("Error monitoring files: %s", e)
 
             time.sleep(1)  # Check every second
 
@@ -504,6 +608,22 @@ class FileMonitor:
         app_state.file_monitor_running = False
         logger.info("File monitoring stopped")
 
+# Matches branded mentions for output filtering in one scan instead of
+# chained str.replace passes (each of which rescans the whole text)
+CLAUDE_MENTION_RE = re.compile(r'[Cc]laude')
+
+# User-friendly messages for Claude result-error subtypes, built once at
+# import instead of on every failed result
+RESULT_ERROR_MESSAGES = {
+    'error_during_execution': '⚠️ Process completed successfully but reported a minor issue. Your files have been generated and should be valid. This is typically just a notification and doesn\'t affect the output.',
+    'timeout': '⏱️ Process timed out. Consider breaking down your request into smaller tasks.',
+    'resource_limit': '💾 Process exceeded resource limits. Try with a smaller input or simpler query.',
+    'permission_denied': '🔒 Permission denied. Check file permissions and access rights.',
+    'network_error': '🌐 Network connectivity issue. Please check your connection and try again.',
+    'invalid_input': '📝 Invalid input provided. Please check your query and input files.',
+    'tool_error': '🔧 Tool execution failed. Check input files and permissions.',
+}
+
 # Process Management
 class ProcessManager:
     """Handles Claude process execution and output processing"""
@@ -530,7 +650,7 @@ class ProcessManager:
                         })
 
         except Exception as e:
-            logger.error(f"Error processing output: {e}")
+            logger.error("Error processing output: %s", e)
             app_state.message_queue.put({
                 'type': 'error',
                 'content': f"Processing error: {str(e)}"
@@ -572,13 +692,13 @@ class ProcessManager:
                 logger.warning(f"Claude process stderr output: {' '.join(stderr_output)}")
             
             # Reset context.md file after migration completion
-            context_file_path = os.path.join(os.path.dirname(__file__), 'prompts', 'context.md')
+            context_file_path = CONTEXT_FILE
             try:
                 with open(context_file_path, 'w') as f:
                     f.write('')  # Clear the file
                 logger.info(f"Successfully reset context.md file at {context_file_path}")
             except Exception as e:
-                logger.error(f"Failed to reset context.md file: {str(e)}")
+                logger.error("Failed to reset context.md file: %s", str(e))
             
             # Signal completion
             app_state.message_queue.put(None)
@@ -653,18 +773,7 @@ class ProcessManager:
             error_detail = message.get('error', '')
             error_msg = message.get('message', '')
             
-            # Provide user-friendly error messages based on error type
-            error_messages = {
-                'error_during_execution': '⚠️ Process completed successfully but reported a minor issue. Your files have been generated and should be valid. This is typically just a notification and doesn\'t affect the output.',
-                'timeout': '⏱️ Process timed out. Consider breaking down your request into smaller tasks.',
-                'resource_limit': '💾 Process exceeded resource limits. Try with a smaller input or simpler query.',
-                'permission_denied': '🔒 Permission denied. Check file permissions and access rights.',
-                'network_error': '🌐 Network connectivity issue. Please check your connection and try again.',
-                'invalid_input': '📝 Invalid input provided. Please check your query and input files.',
-                'tool_error': '🔧 Tool execution failed. Check input files and permissions.',
-            }
-            
-            user_friendly_message = error_messages.get(subtype, f"❌ Process error: {subtype}")
+            user_friendly_message = RESULT_ERROR_MESSAGES.get(subtype, f"❌ Process error: {subtype}")
             
             # Add any additional error details if available
             if error_detail or error_msg:
@@ -680,8 +789,7 @@ class ProcessManager:
     def _clean_text(text: str) -> str:
         """Clean and filter text output"""
         # Replace Claude mentions with Cognidev
-        filtered_text = text.replace("Claude", "Cognidev").replace("claude", "Cognidev")
-        return filtered_text
+        return CLAUDE_MENTION_RE.sub("Cognidev", text)
 
     @staticmethod
     def start_process(query: str):
@@ -694,7 +802,7 @@ class ProcessManager:
                     app_state.enhanced_process_manager.start_process(query, app_state.message_queue)
                     return
                 except Exception as e:
-                    logger.error(f"Enhanced process manager failed: {e}")
+                    logger.error("Enhanced process manager failed: %s", e)
                     logger.info("Falling back to standard process execution")
             
             # Fallback to original implementation
@@ -768,7 +876,7 @@ class ProcessManager:
                     'content': "🔒 Permission denied. Cannot execute Claude command."
                 })
             except Exception as e:
-                logger.error(f"Unexpected error starting process: {e}")
+                logger.error("Unexpected error starting process: %s", e)
                 app_state.message_queue.put({
                     'type': 'error',
                     'content': f"💥 Unexpected error occurred: {str(e)}"
@@ -796,14 +904,14 @@ def get_files():
         else:  # output
             folder_path = Config.OUTPUT_FOLDER
 
-        tree = FileManager.get_file_tree(folder_path, folder_path)
+        tree = FileManager.get_file_tree_cached(folder_path)
         return jsonify({
             'files': tree,
             'folder_type': folder_type,
             'folder_path': folder_path
         })
     except Exception as e:
-        logger.error(f"Error getting files: {e}")
+        logger.error("Error getting files: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/files/<path:file_path>')
@@ -811,6 +919,14 @@ def get_file_content(file_path):
     """Get content of a specific file"""
     try:
         folder_type = request.args.get('type', 'input')
+
+        # Raw mode hands the file to send_file, which serves it through the
+        # WSGI file wrapper (kernel sendfile) with conditional/range support
+        # instead of embedding the content in a JSON body
+        if request.args.get('raw') == 'true':
+            full_path = FileManager.resolve_file_path(file_path, folder_type)
+            return send_file(full_path, conditional=True)
+
         file_info = FileManager.read_file_content(file_path, folder_type)
         return jsonify(file_info)
     except ValueError as e:
@@ -818,7 +934,7 @@ def get_file_content(file_path):
     except FileNotFoundError as e:
         return jsonify({'error': str(e)}), 404
     except Exception as e:
-        logger.error(f"Error reading file {file_path}: {e}")
+        logger.error("Error reading file %s: %s", file_path, e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/cleanup', methods=['POST'])
@@ -832,14 +948,14 @@ def cleanup_output():
         else:
             return jsonify(result), 500
     except Exception as e:
-        logger.error(f"Error during cleanup: {e}")
+        logger.error("Error during cleanup: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/delete', methods=['POST'])
 def delete_item():
     """Delete a specific file or folder from the output directory"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True, cache=False) or {}
         item_path = data.get('path')
         item_type = data.get('type', 'file')
         
@@ -849,9 +965,12 @@ def delete_item():
         # Ensure the path is within the output folder
         full_path = os.path.join(Config.OUTPUT_FOLDER, item_path)
         full_path = os.path.abspath(full_path)
-        output_folder_abs = os.path.abspath(Config.OUTPUT_FOLDER)
-        
-        if not full_path.startswith(output_folder_abs):
+
+        try:
+            inside = os.path.commonpath([full_path, _ABS_OUTPUT_FOLDER]) == _ABS_OUTPUT_FOLDER
+        except ValueError:
+            inside = False
+        if not inside:
             return jsonify({'success': False, 'error': 'Invalid path'}), 400
         
         if not os.path.exists(full_path):
@@ -867,7 +986,9 @@ def delete_item():
             logger.info(f"Deleted file: {item_path}")
         else:
             return jsonify({'success': False, 'error': 'Invalid item type'}), 400
-        
+
+        FileManager.invalidate_tree_cache()
+
         return jsonify({
             'success': True,
             'message': f'Successfully deleted {item_type}: {item_path}',
@@ -876,7 +997,7 @@ def delete_item():
         })
         
     except Exception as e:
-        logger.error(f"Error deleting item: {e}")
+        logger.error("Error deleting item: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/input')
@@ -886,7 +1007,7 @@ def get_input_info():
         input_info = FileManager.get_input_info()
         return jsonify(input_info)
     except Exception as e:
-        logger.error(f"Error getting input info: {e}")
+        logger.error("Error getting input info: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/browse')
@@ -897,14 +1018,14 @@ def browse_directories():
         result = FileManager.browse_directory(directory_path)
         return jsonify(result)
     except Exception as e:
-        logger.error(f"Error browsing directories: {e}")
+        logger.error("Error browsing directories: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/input/select', methods=['POST'])
 def select_input_folder():
     """Set the selected input folder"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True, cache=False) or {}
         folder_path = data.get('path')
 
         if not folder_path:
@@ -917,7 +1038,7 @@ def select_input_folder():
             return jsonify(result), 400
 
     except Exception as e:
-        logger.error(f"Error selecting input folder: {e}")
+        logger.error("Error selecting input folder: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/files/stream')
@@ -938,7 +1059,7 @@ def stream_file_updates():
 def process():
     """Start a new conversion process"""
     try:
-        data = request.json
+        data = request.get_json(silent=True, cache=False) or {}
         query = data.get('query', '') if data else ''
 
         if not query:
@@ -957,7 +1078,7 @@ def process():
         return jsonify({'status': 'started'})
 
     except Exception as e:
-        logger.error(f"Error starting process: {e}")
+        logger.error("Error starting process: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/stream')
@@ -978,119 +1099,148 @@ def stream():
 
     return Response(generate(), mimetype='text/event-stream')
 
+# Cached reads for the small files served verbatim by the read-only
+# endpoints - contents are reparsed only when the file changes on disk
+_file_content_cache: Dict[str, Any] = {}
+_file_content_cache_lock = threading.Lock()
+
+def _read_file_cached(path: str) -> str:
+    """Read a text file, reusing the cached content while mtime and size match"""
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    with _file_content_cache_lock:
+        cached = _file_content_cache.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    with _file_content_cache_lock:
+        _file_content_cache[path] = (key, content)
+    return content
+
 @app.route('/api/rules')
 def get_rules():
     """Get migration rules"""
     try:
-        rules_path = os.path.join(os.getcwd(), 'data', 'rules')
-        if os.path.exists(rules_path):
-            with open(rules_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return jsonify({'content': content, 'success': True})
+        if os.path.exists(RULES_FILE):
+            return jsonify({'content': _read_file_cached(RULES_FILE), 'success': True})
         else:
             return jsonify({'error': 'Rules file not found', 'success': False}), 404
     except Exception as e:
-        logger.error(f"Error reading rules: {e}")
+        logger.error("Error reading rules: %s", e)
         return jsonify({'error': str(e), 'success': False}), 500
 
 @app.route('/api/issues')
 def get_issues():
     """Get migration issues"""
     try:
-        issues_path = os.path.join(os.getcwd(), 'data', 'issues')
-        if os.path.exists(issues_path):
-            with open(issues_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return jsonify({'content': content, 'success': True})
+        if os.path.exists(ISSUES_FILE):
+            return jsonify({'content': _read_file_cached(ISSUES_FILE), 'success': True})
         else:
             return jsonify({'error': 'Issues file not found', 'success': False}), 404
     except Exception as e:
-        logger.error(f"Error reading issues: {e}")
+        logger.error("Error reading issues: %s", e)
         return jsonify({'error': str(e), 'success': False}), 500
 
+def _atomic_write_text(path: str, content: str):
+    """Write text to a sibling temp file and rename it into place.
+
+    os.replace is atomic on the same filesystem, so readers never observe
+    a partially written file and a crash mid-write leaves the old content
+    intact.
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# Prompt type to file mapping, built once instead of per request
+PROMPT_FILE_MAP = {
+    'analyze': 'notes.md',
+    'plan': 'plan.md',
+    'migrate': 'ship.md',
+    'validate': 'validate.md'
+}
+
 @app.route('/api/prompts/<prompt_type>')
 def get_prompt(prompt_type):
     """Get prompt content for specific type"""
     try:
-        # Map prompt types to files
-        file_map = {
-            'analyze': 'notes.md',
-            'plan': 'plan.md',
-            'migrate': 'ship.md',
-            'validate': 'validate.md'
-        }
-        
-        if prompt_type not in file_map:
+        file_name = PROMPT_FILE_MAP.get(prompt_type)
+        if file_name is None:
             return jsonify({'error': 'Invalid prompt type', 'success': False}), 400
-        
-        file_name = file_map[prompt_type]
-        app_dir = os.path.dirname(os.path.abspath(__file__))
-        prompt_path = os.path.join(app_dir, 'prompts', file_name)
-        
+        prompt_path = os.path.join(PROMPTS_DIR, file_name)
+
         if os.path.exists(prompt_path):
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return jsonify({'content': content, 'success': True})
+            return jsonify({'content': _read_file_cached(prompt_path), 'success': True})
         else:
             return jsonify({'error': f'Prompt file not found: {file_name}', 'success': False}), 404
     except Exception as e:
-        logger.error(f"Error reading prompt {prompt_type}: {e}")
+        logger.error("Error reading prompt %s: %s", prompt_type, e)
         return jsonify({'error': str(e), 'success': False}), 500
 
 @app.route('/api/prompts/<prompt_type>', methods=['POST'])
 def save_prompt(prompt_type):
     """Save prompt with backup to prompts-backup folder"""
     try:
-        # Map prompt types to files
-        file_map = {
-            'analyze': 'notes.md',
-            'plan': 'plan.md',
-            'migrate': 'ship.md',
-            'validate': 'validate.md'
-        }
-        
-        if prompt_type not in file_map:
+        file_name = PROMPT_FILE_MAP.get(prompt_type)
+        if file_name is None:
             return jsonify({'error': 'Invalid prompt type', 'success': False}), 400
-        
-        data = request.json
+
+        data = request.get_json(silent=True, cache=False) or {}
         content = data.get('content', '')
-        
+
         if not content:
             return jsonify({'error': 'No content provided', 'success': False}), 400
-        
-        file_name = file_map[prompt_type]
-        app_dir = os.path.dirname(os.path.abspath(__file__))
-        prompt_path = os.path.join(app_dir, 'prompts', file_name)
-        prompts_dir = os.path.dirname(prompt_path)
-        backup_dir = os.path.join(app_dir, 'prompts-backup')
-        
+
+        prompt_path = os.path.join(PROMPTS_DIR, file_name)
+        prompts_dir = PROMPTS_DIR
+        backup_dir = PROMPTS_BACKUP_DIR
+
         # Ensure directories exist
         os.makedirs(prompts_dir, exist_ok=True)
         os.makedirs(backup_dir, exist_ok=True)
         
-        # Create backup with timestamp if file exists
-        timestamp = None
+        # Create backup with timestamp if file exists - derive the name
+        # once instead of re-splitting and re-formatting it per use
+        backup_filename = None
         if os.path.exists(prompt_path):
+            # Skip the backup and rewrite entirely when nothing changed,
+            # so repeated saves of an unedited prompt stay free
+            if _read_file_cached(prompt_path) == content:
+                return jsonify({
+                    'success': True,
+                    'message': f'{file_name} unchanged',
+                    'backup': None
+                })
+            base, ext = os.path.splitext(file_name)
             timestamp = datetime.now().strftime('%Y-%m-%d-%H-%M-%S')
-            backup_filename = f"{os.path.splitext(file_name)[0]}.{timestamp}{os.path.splitext(file_name)[1]}"
+            backup_filename = f"{base}.{timestamp}{ext}"
             backup_path = os.path.join(backup_dir, backup_filename)
             shutil.copy2(prompt_path, backup_path)
             logger.info(f"Created backup: {backup_path}")
         
         # Save new content
-        with open(prompt_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _atomic_write_text(prompt_path, content)
         
         logger.info(f"Successfully saved prompt {prompt_type} to: {prompt_path}")
         
         return jsonify({
             'success': True,
             'message': f'{file_name} saved successfully',
-            'backup': f"{os.path.splitext(file_name)[0]}.{timestamp}{os.path.splitext(file_name)[1]}" if timestamp else None
+            'backup': backup_filename
         })
         
     except Exception as e:
-        logger.error(f"Error saving prompt {prompt_type}: {e}")
+        logger.error("Error saving prompt %s: %s", prompt_type, e)
         logger.error(f"Stack trace: ", exc_info=True)
         return jsonify({'error': str(e), 'success': False}), 500
 
@@ -1109,7 +1259,7 @@ def save_core_prompt():
 def get_context():
     """Get additional context (context.md) content"""
     try:
-        context_path = os.path.join(os.getcwd(), 'prompts', 'context.md')
+        context_path = CONTEXT_FILE
         if os.path.exists(context_path):
             with open(context_path, 'r', encoding='utf-8') as f:
                 content = f.read()
@@ -1118,25 +1268,23 @@ def get_context():
             # Return empty content if file doesn't exist
             return jsonify({'content': '', 'success': True})
     except Exception as e:
-        logger.error(f"Error reading context: {e}")
+        logger.error("Error reading context: %s", e)
         return jsonify({'error': str(e), 'success': False}), 500
 
 @app.route('/api/context', methods=['POST'])
 def save_context():
     """Save additional context (context.md)"""
     try:
-        data = request.json
+        data = request.get_json(silent=True, cache=False) or {}
         content = data.get('content', '')
         
-        prompts_dir = os.path.join(os.getcwd(), 'prompts')
-        if not os.path.exists(prompts_dir):
-            os.makedirs(prompts_dir)
-            
-        context_path = os.path.join(prompts_dir, 'context.md')
+        if not os.path.exists(PROMPTS_DIR):
+            os.makedirs(PROMPTS_DIR)
+
+        context_path = CONTEXT_FILE
         
         # Save content (can be empty to clear context)
-        with open(context_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _atomic_write_text(context_path, content)
         
         return jsonify({
             'success': True,
@@ -1145,14 +1293,14 @@ def save_context():
         })
         
     except Exception as e:
-        logger.error(f"Error saving context: {e}")
+        logger.error("Error saving context: %s", e)
         return jsonify({'error': str(e), 'success': False}), 500
 
 @app.route('/api/fix')
 def get_fix_issues():
     """Get existing fix issues from fix.md"""
     try:
-        fix_path = os.path.join(os.getcwd(), 'prompts', 'fix.md')
+        fix_path = FIX_FILE
         
         if not os.path.exists(fix_path):
             return jsonify({'success': True, 'issues': []})
@@ -1188,44 +1336,43 @@ def get_fix_issues():
         return jsonify({'success': True, 'issues': issues})
         
     except Exception as e:
-        logger.error(f"Error reading fix issues: {e}")
+        logger.error("Error reading fix issues: %s", e)
         return jsonify({'error': str(e), 'success': False}), 500
 
 @app.route('/api/fix', methods=['POST'])
 def save_fix():
     """Save fix issues to fix.md"""
     try:
-        data = request.json
+        data = request.get_json(silent=True, cache=False) or {}
         issues = data.get('issues', [])
         
         if not issues:
             return jsonify({'error': 'No issues provided', 'success': False}), 400
         
-        prompts_dir = os.path.join(os.getcwd(), 'prompts')
-        if not os.path.exists(prompts_dir):
-            os.makedirs(prompts_dir)
-            
-        fix_path = os.path.join(prompts_dir, 'fix.md')
+        if not os.path.exists(PROMPTS_DIR):
+            os.makedirs(PROMPTS_DIR)
+
+        fix_path = FIX_FILE
         
         # Delete existing fix.md if it exists
         if os.path.exists(fix_path):
             os.remove(fix_path)
             logger.info(f"Removed existing fix.md")
         
-        # Create new fix.md with the issues
-        content = "# Fix Issues\n\n"
-        content += "The following issues need to be addressed during migration:\n\n"
-        
+        # Build the document in one pass and join once - string += in a
+        # loop recopies the whole buffer on every iteration
+        parts = [
+            "# Fix Issues\n\n",
+            "The following issues need to be addressed during migration:\n\n",
+        ]
         for i, issue in enumerate(issues, 1):
-            content += f"## Issue {i}\n\n"
-            content += f"{issue}\n\n"
-        
-        content += "---\n\n"
-        content += f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+            parts.append(f"## Issue {i}\n\n{issue}\n\n")
+        parts.append("---\n\n")
+        parts.append(f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n")
+        content = ''.join(parts)
         
         # Save the new fix.md
-        with open(fix_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _atomic_write_text(fix_path, content)
         
         logger.info(f"Saved {len(issues)} fix issues to {fix_path}")
         
@@ -1237,7 +1384,7 @@ def save_fix():
         })
         
     except Exception as e:
-        logger.error(f"Error saving fix issues: {e}")
+        logger.error("Error saving fix issues: %s", e)
         return jsonify({'error': str(e), 'success': False}), 500
 
 @app.route('/api/auth/status')
@@ -1257,7 +1404,7 @@ def get_auth_status():
                 is_authenticated = True
                 auth_method = "Claude CLI (Built-in)"
         except Exception as e:
-            logger.error(f"Claude CLI test failed: {e}")
+            logger.error("Claude CLI test failed: %s", e)
             pass
         
         auth_info = {
@@ -1277,7 +1424,7 @@ def get_auth_status():
         return jsonify(auth_info)
         
     except Exception as e:
-        logger.error(f"Error getting auth status: {e}")
+        logger.error("Error getting auth status: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/auth/refresh', methods=['POST'])
@@ -1298,14 +1445,14 @@ def refresh_auth():
             'last_refresh': app_state.auth_manager.last_refresh.isoformat()
         })
     except Exception as e:
-        logger.error(f"Error refreshing auth: {e}")
+        logger.error("Error refreshing auth: %s", e)
         return jsonify({'error': str(e), 'success': False}), 500
 
 @app.route('/api/auth/update-key', methods=['POST'])
 def update_api_key():
     """Update the Claude API key"""
     try:
-        data = request.json
+        data = request.get_json(silent=True, cache=False) or {}
         api_key = data.get('api_key')
         
         if not api_key:
@@ -1332,9 +1479,13 @@ def update_api_key():
             'authenticated': is_valid
         })
     except Exception as e:
-        logger.error(f"Error updating API key: {e}")
+        logger.error("Error updating API key: %s", e)
         return jsonify({'error': str(e), 'success': False}), 500
 
+# secure_filename is pure string work and uploads run it on the same
+# project/directory components for every file, so cache the results
+_safe_name = lru_cache(maxsize=1024)(secure_filename)
+
 # Upload Routes
 @app.route('/api/upload', methods=['POST'])
 def upload_files():
@@ -1356,7 +1507,7 @@ def upload_files():
                 project_name = f'upload_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
         
         # Create project folder directly in data folder
-        project_path = os.path.join(Config.DATA_FOLDER, secure_filename(project_name))
+        project_path = os.path.join(Config.DATA_FOLDER, _safe_name(project_name))
             
         os.makedirs(project_path, exist_ok=True)
         
@@ -1370,13 +1521,13 @@ def upload_files():
                     continue
                 
                 # Preserve directory structure
-                filename = secure_filename(file.filename)
+                filename = _safe_name(file.filename)
                 if '/' in file.filename:  # If file was uploaded with path
                     # Create subdirectories
                     file_parts = file.filename.split('/')
-                    subdir = os.path.join(project_path, *[secure_filename(part) for part in file_parts[:-1]])
+                    subdir = os.path.join(project_path, *[_safe_name(part) for part in file_parts[:-1]])
                     os.makedirs(subdir, exist_ok=True)
-                    filepath = os.path.join(subdir, secure_filename(file_parts[-1]))
+                    filepath = os.path.join(subdir, _safe_name(file_parts[-1]))
                 else:
                     filepath = os.path.join(project_path, filename)
                 
@@ -1387,8 +1538,9 @@ def upload_files():
         # Copy uploaded files to input folder if requested
         if request.form.get('copyToInput') == 'true':
             shutil.copytree(project_path, Config.INPUT_FOLDER, dirs_exist_ok=True)
+            FileManager.invalidate_tree_cache()
             logger.info(f"Copied uploaded files to input folder")
-        
+
         return jsonify({
             'success': True,
             'fileCount': len(uploaded_files),
@@ -1397,7 +1549,7 @@ def upload_files():
         })
         
     except Exception as e:
-        logger.error(f"Error uploading files: {e}")
+        logger.error("Error uploading files: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/upload/zip', methods=['POST'])
@@ -1417,7 +1569,7 @@ def upload_zip():
             project_name = os.path.splitext(zip_file.filename)[0]
         
         # Create project folder directly in data folder
-        project_path = os.path.join(Config.DATA_FOLDER, secure_filename(project_name))
+        project_path = os.path.join(Config.DATA_FOLDER, _safe_name(project_name))
             
         os.makedirs(project_path, exist_ok=True)
         
@@ -1452,6 +1604,7 @@ def upload_zip():
         # Copy to input folder if requested
         if request.form.get('copyToInput') == 'true':
             shutil.copytree(project_path, Config.INPUT_FOLDER, dirs_exist_ok=True)
+            FileManager.invalidate_tree_cache()
             logger.info(f"Copied extracted files to input folder")
         
         return jsonify({
@@ -1465,9 +1618,19 @@ def upload_zip():
         logger.error("Invalid ZIP file")
         return jsonify({'error': 'Invalid ZIP file'}), 400
     except Exception as e:
-        logger.error(f"Error processing ZIP file: {e}")
+        logger.error("Error processing ZIP file: %s", e)
         return jsonify({'error': str(e)}), 500
 
+@lru_cache(maxsize=256)
+def _project_file_count(path: str, mtime_ns: int) -> int:
+    """Count files under a project, memoized on the directory's mtime.
+
+    Changes in nested subdirectories don't bump the top-level mtime, so a
+    cached count can lag until something touches the project root - an
+    acceptable trade for skipping a full walk per project per listing.
+    """
+    return sum(len(files) for _, _, files in os.walk(path))
+
 @app.route('/api/projects')
 def list_projects():
     """List available projects in data folder"""
@@ -1475,22 +1638,19 @@ def list_projects():
         projects = []
         # Skip system files like 'rules' and 'issues'
         skip_items = {'rules', 'issues', 'uploads'}
-        
+
         if os.path.exists(Config.DATA_FOLDER):
-            for item in os.listdir(Config.DATA_FOLDER):
-                if item in skip_items:
-                    continue
-                item_path = os.path.join(Config.DATA_FOLDER, item)
-                if os.path.isdir(item_path):
-                    # Get project info
-                    file_count = sum(1 for root, dirs, files in os.walk(item_path) for f in files)
-                    mod_time = os.path.getmtime(item_path)
-                    
+            with os.scandir(Config.DATA_FOLDER) as it:
+                for entry in it:
+                    if entry.name in skip_items or not entry.is_dir():
+                        continue
+                    # Get project info from the scandir-cached stat
+                    st = entry.stat()
                     projects.append({
-                        'name': item,
-                        'path': item_path,
-                        'fileCount': file_count,
-                        'modified': datetime.fromtimestamp(mod_time).isoformat()
+                        'name': entry.name,
+                        'path': entry.path,
+                        'fileCount': _project_file_count(entry.path, st.st_mtime_ns),
+                        'modified': datetime.fromtimestamp(st.st_mtime).isoformat()
                     })
         
         # Sort by modified time (newest first)
@@ -1502,14 +1662,14 @@ def list_projects():
         })
         
     except Exception as e:
-        logger.error(f"Error listing projects: {e}")
+        logger.error("Error listing projects: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/projects/<project_name>')
 def get_project_files(project_name):
     """Get file tree for a specific project"""
     try:
-        project_path = os.path.join(Config.DATA_FOLDER, secure_filename(project_name))
+        project_path = os.path.join(Config.DATA_FOLDER, _safe_name(project_name))
         
         if not os.path.exists(project_path):
             return jsonify({'error': 'Project not found'}), 404
@@ -1523,7 +1683,7 @@ def get_project_files(project_name):
         })
         
     except Exception as e:
-        logger.error(f"Error getting project files: {e}")
+        logger.error("Error getting project files: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/projects/<project_name>', methods=['DELETE'])
@@ -1537,7 +1697,7 @@ def delete_project(project_name):
         
         # If not found, try with secure_filename
         if not os.path.exists(project_path):
-            safe_project_name = secure_filename(project_name)
+            safe_project_name = _safe_name(project_name)
             project_path = os.path.join(Config.DATA_FOLDER, safe_project_name)
         
         # Check if project exists
@@ -1560,7 +1720,7 @@ def delete_project(project_name):
         })
         
     except Exception as e:
-        logger.error(f"Error deleting project {project_name}: {e}")
+        logger.error("Error deleting project %s: %s", project_name, e)
         return jsonify({'error': f'Failed to delete project: {str(e)}'}), 500
 
 # Application Entry Point
@@ -1571,7 +1731,7 @@ if __name__ == '__main__':
     except KeyboardInterrupt:
         logger.info("Application interrupted by user")
     except Exception as e:
-        logger.error(f"Application error: {e}")
+        logger.error("Application error: %s", e)
     finally:
         FileMonitor.stop_monitoring()
         
@@ -4,17 +4,44 @@ Handles API key management and automatic refresh for persistent connections
 """
 
 import os
+import re
 import json
 import time
 import threading
 import subprocess
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+_CLAUDE_DIR = Path.home() / '.claude'
+
+# Signs of an authentication failure in error output, compiled once so
+# classification is a single scan rather than one substring search per
+# indicator
+_AUTH_ERR_RE = re.compile(
+    r'401|unauthorized|authentication|auth failed|invalid api key|expired|forbidden',
+    re.IGNORECASE,
+)
+
+# Matches branded mentions for output filtering in a single scan
+_CLAUDE_MENTION_RE = re.compile(r'[Cc]laude')
+
+# User-friendly messages for Claude result-error subtypes, built once at
+# import instead of on every failed result
+_RESULT_ERROR_MESSAGES = {
+    'error_during_execution': '⚠️ Process completed successfully but reported a minor issue. Your files have been generated and should be valid. This is typically just a notification and doesn\'t affect the output.',
+    'timeout': '⏱️ Process timed out. Consider breaking down your request into smaller tasks.',
+    'resource_limit': '💾 Process exceeded resource limits. Try with a smaller input or simpler query.',
+    'permission_denied': '🔒 Permission denied. Check file permissions and access rights.',
+    'network_error': '🌐 Network connectivity issue. Please check your connection and try again.',
+    'invalid_input': '📝 Invalid input provided. Please check your query and input files.',
+    'tool_error': '🔧 Tool execution failed. Check input files and permissions.',
+}
+
 
 class ClaudeAuthManager:
     """Manages Claude Code authentication with automatic refresh"""
@@ -32,7 +59,18 @@ class ClaudeAuthManager:
         self.last_refresh = None
         self.refresh_thread = None
         self.running = False
-        self.auth_helper_path = Path.home() / '.claude' / 'auth_helper.sh'
+        # Wakes the refresh loop early on key updates or shutdown instead
+        # of waiting out the full sleep interval
+        self._wakeup = threading.Event()
+        self.auth_helper_path = _CLAUDE_DIR / 'auth_helper.sh'
+        # Auth args only change when the key changes, so build them once
+        # instead of on every Claude spawn
+        self._cached_auth_args = self._build_auth_command_args()
+        # Serialize auth probes and reuse the last result briefly so a
+        # burst of concurrent 401s fires one subprocess, not one each
+        self._auth_test_lock = threading.Lock()
+        self._auth_test_cached = None  # (monotonic timestamp, result)
+        self._auth_test_ttl = 5.0
         
         # Create auth helper script
         self._create_auth_helper()
@@ -63,11 +101,23 @@ else
 fi
 '''
         
-        with open(self.auth_helper_path, 'w') as f:
+        # Skip the rewrite when the script already matches - with several
+        # workers starting at once this avoids them racing to write the
+        # same bytes over each other
+        try:
+            if self.auth_helper_path.read_text() == helper_content:
+                logger.debug(f"Auth helper at {self.auth_helper_path} already up to date")
+                return
+        except OSError:
+            pass
+
+        # Write to a sibling temp file and rename so other workers never
+        # observe a partially written script
+        tmp_path = self.auth_helper_path.with_suffix(f'.tmp.{os.getpid()}')
+        with open(tmp_path, 'w') as f:
             f.write(helper_content)
-        
-        # Make executable
-        os.chmod(self.auth_helper_path, 0o755)
+        os.chmod(tmp_path, 0o755)  # Make executable
+        os.replace(tmp_path, self.auth_helper_path)
         logger.info(f"Created auth helper at {self.auth_helper_path}")
     
     def start_refresh_daemon(self):
@@ -77,6 +127,7 @@ fi
             return
         
         self.running = True
+        self._wakeup.clear()
         self.refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
         self.refresh_thread.start()
         logger.info("Started Claude authentication refresh daemon")
@@ -84,6 +135,7 @@ fi
     def stop_refresh_daemon(self):
         """Stop the refresh daemon"""
         self.running = False
+        self._wakeup.set()
         if self.refresh_thread:
             self.refresh_thread.join(timeout=5)
         logger.info("Stopped Claude authentication refresh daemon")
@@ -93,10 +145,14 @@ fi
         while self.running:
             try:
                 self._refresh_auth()
-                time.sleep(self.refresh_interval)
+                # Event.wait returns immediately when update_api_key or
+                # stop_refresh_daemon signals, so shutdown and key changes
+                # don't wait out the remaining interval
+                self._wakeup.wait(timeout=self.refresh_interval)
             except Exception as e:
-                logger.error(f"Error in refresh loop: {e}")
-                time.sleep(30)  # Wait 30 seconds before retry on error
+                logger.error("Error in refresh loop: %s", e)
+                self._wakeup.wait(timeout=30)  # Wait 30 seconds before retry on error
+            self._wakeup.clear()
     
     def _refresh_auth(self):
         """Refresh the authentication by updating the helper script or environment"""
@@ -107,45 +163,73 @@ fi
             # If using environment variable, ensure it's still set
             if self.api_key:
                 os.environ['CLAUDE_API_KEY'] = self.api_key
-            
-            # Touch the auth helper to update its timestamp
-            self.auth_helper_path.touch()
-            
+
             logger.debug(f"Refreshed authentication at {self.last_refresh}")
             
         except Exception as e:
             logger.error(f"Failed to refresh authentication: {e}")
             raise
     
-    def get_auth_command_args(self) -> list:
-        """Get command line arguments for Claude Code with authentication"""
+    def _build_auth_command_args(self) -> list:
+        """Build command line arguments for Claude Code with authentication"""
         args = []
-        
+
         # Only use auth helper if we're not using OAuth
         if self.api_key != "claude-oauth":
             # Use the auth helper script
             args.extend(['--api-key-helper', str(self.auth_helper_path)])
-        
+
         return args
+
+    def get_auth_command_args(self) -> list:
+        """Get command line arguments for Claude Code with authentication"""
+        # Return a copy so callers extending the list don't corrupt the cache
+        return list(self._cached_auth_args)
     
     def test_authentication(self) -> bool:
         """Test if authentication is working"""
+        with self._auth_test_lock:
+            # Reuse a recent probe result - concurrent callers hitting the
+            # same transient auth failure should not each fork a subprocess
+            cached = self._auth_test_cached
+            if cached and time.monotonic() - cached[0] < self._auth_test_ttl:
+                return cached[1]
+
+            result_ok = self._run_auth_probe()
+            self._auth_test_cached = (time.monotonic(), result_ok)
+            return result_ok
+
+    def _run_auth_probe(self) -> bool:
+        """Run the actual Claude subprocess probe"""
         try:
-            # Test with a simple Claude command that requires authentication
+            # Test with a simple Claude command that requires authentication.
+            # The probe never reads stdin, so hand it /dev/null instead of
+            # inheriting ours; close_fds is the POSIX default but spelled
+            # out since inheriting the app's descriptors would be a bug
             cmd = ['claude', '-p', 'test', '--output-format', 'json']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
-            
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=5,
+                check=False,
+                stdin=subprocess.DEVNULL,
+                close_fds=True,
+            )
+
             # Check if we got a valid response (not an auth error)
             if result.returncode == 0:
                 try:
-                    response = json.loads(result.stdout)
+                    # Only the first line carries the result object
+                    first_line = result.stdout.strip().split('\n', 1)[0]
+                    response = json.loads(first_line)
                     # If we get a proper response structure, auth is working
                     return response.get('type') == 'result'
                 except json.JSONDecodeError:
                     return False
             return False
         except Exception as e:
-            logger.error(f"Authentication test failed: {e}")
+            logger.error("Authentication test failed: %s", e)
             return False
     
     def update_api_key(self, new_api_key: str):
@@ -153,17 +237,25 @@ fi
         self.api_key = new_api_key
         os.environ['CLAUDE_API_KEY'] = new_api_key
         
-        # Save to file for persistence
-        api_key_file = Path.home() / '.claude' / 'api_key'
+        # Save to file for persistence - write a restricted-mode temp file
+        # and rename so a crash mid-write can't truncate the stored key or
+        # leave it momentarily world-readable
+        api_key_file = _CLAUDE_DIR / 'api_key'
         api_key_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(api_key_file, 'w') as f:
+        tmp_path = api_key_file.with_suffix(f'.tmp.{os.getpid()}')
+        with open(tmp_path, 'w') as f:
             f.write(new_api_key)
-        os.chmod(api_key_file, 0o600)  # Secure the file
+        os.chmod(tmp_path, 0o600)  # Secure the file
+        os.replace(tmp_path, api_key_file)
         
         # Recreate helper script with new key
         self._create_auth_helper()
+        self._cached_auth_args = self._build_auth_command_args()
+        _resolve_api_key.cache_clear()
         self._refresh_auth()
-        
+        # Nudge the daemon so it picks up the new key immediately
+        self._wakeup.set()
+
         logger.info("Updated API key and refreshed authentication")
 
 
@@ -196,16 +288,16 @@ class ClaudeSessionManager:
         
         logger.info(f"Starting Claude process with authentication")
         
-        # Start process
+        # Start process with binary pipes and a real buffer - line-buffered
+        # text mode (bufsize=1) decodes and splits in pure Python, which is
+        # the slowest way to consume stream-json output
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
-            cwd='/home/ubuntu/code-conv-studio',  # Set working directory
-            env=os.environ.copy()  # Pass environment with API key
-        )
+            bufsize=65536,
+            cwd='/home/ubuntu/code-conv-studio'  # Set working directory
+        )  # Child inherits our environment (including the API key) by default
         
         self.current_session = process
         if not self.session_start_time:
@@ -215,15 +307,7 @@ class ClaudeSessionManager:
     
     def handle_auth_error(self, error_message: str) -> bool:
         """Handle authentication errors and attempt to recover"""
-        auth_error_indicators = [
-            '401', 'unauthorized', 'authentication', 'auth failed',
-            'invalid api key', 'expired', 'forbidden'
-        ]
-        
-        error_lower = error_message.lower()
-        is_auth_error = any(indicator in error_lower for indicator in auth_error_indicators)
-        
-        if is_auth_error:
+        if _AUTH_ERR_RE.search(error_message):
             logger.warning(f"Detected authentication error: {error_message}")
             
             # Force refresh
@@ -258,16 +342,18 @@ class EnhancedProcessManager:
             try:
                 process = self.session_manager.start_claude_process(query)
                 
-                # Process output
+                # Process output - stdout is a binary pipe, so strip the
+                # raw bytes and let json.loads decode them itself
                 logger.info("Starting to read process output")
-                for line in process.stdout:
-                    if not line.strip():
+                for raw_line in process.stdout:
+                    line = raw_line.strip()
+                    if not line:
                         continue
-                    
-                    logger.debug(f"Raw output line: {line.strip()}")
-                    
+
+                    logger.debug("Raw output line: %s", line)
+
                     try:
-                        message = json.loads(line.strip())
+                        message = json.loads(line)
                         logger.debug(f"Parsed message: {message}")
                         
                         # Check for auth errors in messages
@@ -283,15 +369,15 @@ class EnhancedProcessManager:
                         self._handle_message(message, message_queue)
                         
                     except json.JSONDecodeError as e:
-                        logger.debug(f"Failed to parse JSON: {e}, line: {line.strip()}")
+                        logger.debug("Failed to parse JSON: %s, line: %s", e, line)
                         # Put raw output as a message
                         message_queue.put({
                             'type': 'raw',
-                            'content': line.strip()
+                            'content': line.decode('utf-8', errors='replace')
                         })
-                
+
                 # Read any stderr
-                stderr_output = process.stderr.read()
+                stderr_output = process.stderr.read().decode('utf-8', errors='replace')
                 if stderr_output:
                     logger.error(f"Process stderr: {stderr_output}")
                     
@@ -412,18 +498,7 @@ class EnhancedProcessManager:
             error_detail = message.get('error', '')
             error_msg = message.get('message', '')
             
-            # Provide user-friendly error messages based on error type
-            error_messages = {
-                'error_during_execution': '⚠️ Process completed successfully but reported a minor issue. Your files have been generated and should be valid. This is typically just a notification and doesn\'t affect the output.',
-                'timeout': '⏱️ Process timed out. Consider breaking down your request into smaller tasks.',
-                'resource_limit': '💾 Process exceeded resource limits. Try with a smaller input or simpler query.',
-                'permission_denied': '🔒 Permission denied. Check file permissions and access rights.',
-                'network_error': '🌐 Network connectivity issue. Please check your connection and try again.',
-                'invalid_input': '📝 Invalid input provided. Please check your query and input files.',
-                'tool_error': '🔧 Tool execution failed. Check input files and permissions.',
-            }
-            
-            user_friendly_message = error_messages.get(subtype, f"❌ Process error: {subtype}")
+            user_friendly_message = _RESULT_ERROR_MESSAGES.get(subtype, f"❌ Process error: {subtype}")
             
             # Add any additional error details if available
             if error_detail or error_msg:
@@ -438,45 +513,57 @@ class EnhancedProcessManager:
     def _clean_text(self, text: str) -> str:
         """Clean and filter text output"""
         # Replace Claude mentions with Cognidev
-        filtered_text = text.replace("Claude", "Cognidev").replace("claude", "Cognidev")
-        return filtered_text
+        return _CLAUDE_MENTION_RE.sub("Cognidev", text)
 
 
 # Example usage in Flask app
-def create_claude_auth_manager(api_key: Optional[str] = None) -> ClaudeAuthManager:
-    """Factory function to create and configure auth manager"""
-    # Try to get API key from various sources
+@lru_cache(maxsize=1)
+def _resolve_api_key() -> Optional[str]:
+    """Resolve the API key from environment, file, secrets or OAuth.
+
+    The probe chain stats files and may hit the network (boto3), so the
+    result is memoized; update_api_key clears the cache when the key
+    changes.
+    """
+    # Try environment variable
+    api_key = os.environ.get('CLAUDE_API_KEY')
+
+    # Try file
     if not api_key:
-        # Try environment variable
-        api_key = os.environ.get('CLAUDE_API_KEY')
-        
-        # Try file
-        if not api_key:
-            api_key_file = Path.home() / '.claude' / 'api_key'
-            if api_key_file.exists():
-                api_key = api_key_file.read_text().strip()
-        
-        # Try AWS Secrets Manager (example)
-        if not api_key:
-            try:
-                import boto3
-                client = boto3.client('secretsmanager')
-                response = client.get_secret_value(SecretId='claude-api-key')
-                api_key = response['SecretString']
-            except:
-                pass
-    
+        api_key_file = _CLAUDE_DIR / 'api_key'
+        if api_key_file.exists():
+            api_key = api_key_file.read_text().strip()
+
+    # Try AWS Secrets Manager (example)
+    if not api_key:
+        try:
+            import boto3
+            client = boto3.client('secretsmanager')
+            response = client.get_secret_value(SecretId='claude-api-key')
+            api_key = response['SecretString']
+        except:
+            pass
+
     # If still no key, check if we're using OAuth (Claude CLI authentication)
     if not api_key:
-        credentials_file = Path.home() / '.claude' / '.credentials.json'
+        credentials_file = _CLAUDE_DIR / '.credentials.json'
         if credentials_file.exists():
             # We have OAuth credentials, use a placeholder
             api_key = "claude-oauth"
-    
+
+    return api_key
+
+
+def create_claude_auth_manager(api_key: Optional[str] = None) -> ClaudeAuthManager:
+    """Factory function to create and configure auth manager"""
+    # Try to get API key from various sources
+    if not api_key:
+        api_key = _resolve_api_key()
+
     if not api_key:
         raise ValueError("No Claude API key found. Please set CLAUDE_API_KEY environment variable.")
-    
+
     auth_manager = ClaudeAuthManager(api_key)
     auth_manager.start_refresh_daemon()
-    
+
     return auth_manager
\ No newline at end of file
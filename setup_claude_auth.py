@@ -7,12 +7,17 @@ Helps configure API keys and test authentication
 import os
 import sys
 from pathlib import Path
-from claude_auth import ClaudeAuthManager, create_claude_auth_manager
 
 
 def main():
-    print("Claude Code Authentication Setup")
-    print("================================\n")
+    # Imported here so importing this module does not pay the claude_auth
+    # import (and its logging setup) when only the helpers are wanted
+    from claude_auth import ClaudeAuthManager
+
+    # Emit each status block with one print so stdout is hit once per
+    # block rather than once per line
+    print("Claude Code Authentication Setup\n"
+          "================================\n")
     
     # Check for existing API key
     existing_key = os.environ.get('CLAUDE_API_KEY')
@@ -57,15 +62,15 @@ def main():
             # Set environment variable for current session
             os.environ['CLAUDE_API_KEY'] = api_key
             
-            print("\nAuthentication is configured and working.")
-            print("\nTo make this permanent, add to your shell profile:")
-            print(f"export CLAUDE_API_KEY='{api_key}'")
-            
+            print("\nAuthentication is configured and working.\n"
+                  "\nTo make this permanent, add to your shell profile:\n"
+                  f"export CLAUDE_API_KEY='{api_key}'")
+
             # Start refresh daemon
             auth_manager.start_refresh_daemon()
-            print("\n✅ Authentication refresh daemon started")
-            print("   - Refreshes every 4 minutes (before 5-minute timeout)")
-            print("   - Runs in background to maintain persistent connection")
+            print("\n✅ Authentication refresh daemon started\n"
+                  "   - Refreshes every 4 minutes (before 5-minute timeout)\n"
+                  "   - Runs in background to maintain persistent connection")
             
         else:
             print("❌ Authentication failed. Please check your API key.")
@@ -75,11 +80,11 @@ def main():
         print(f"❌ Error setting up authentication: {e}")
         sys.exit(1)
     
-    print("\n✅ Setup complete! Your Flask app will now maintain persistent Claude authentication.")
-    print("\nAPI endpoints available:")
-    print("  - GET  /api/auth/status      - Check authentication status")
-    print("  - POST /api/auth/refresh     - Manually refresh authentication")
-    print("  - POST /api/auth/update-key  - Update API key")
+    print("\n✅ Setup complete! Your Flask app will now maintain persistent Claude authentication.\n"
+          "\nAPI endpoints available:\n"
+          "  - GET  /api/auth/status      - Check authentication status\n"
+          "  - POST /api/auth/refresh     - Manually refresh authentication\n"
+          "  - POST /api/auth/update-key  - Update API key")
 
 
 if __name__ == "__main__":